@@ -3,6 +3,7 @@ from __future__ import annotations
 import logging
 from dataclasses import dataclass, field
 from pathlib import Path
+from types import MappingProxyType
 from typing import TYPE_CHECKING
 
 from deptry.dependency_getter.pep621.base import PEP621DependencyGetter
@@ -10,8 +11,8 @@ from deptry.dependency_getter.pep621.pdm import PDMDependencyGetter
 from deptry.dependency_getter.pep621.poetry import PoetryDependencyGetter
 from deptry.dependency_getter.pep621.uv import UvDependencyGetter
 from deptry.dependency_getter.requirements_files import RequirementsTxtDependencyGetter
-from deptry.exceptions import DependencySpecificationNotFoundError
-from deptry.utils import load_pyproject_toml
+from deptry.exceptions import DependencySpecificationNotFoundError, PyprojectFileNotFoundError
+from deptry.utils import clear_pyproject_toml_cache, load_pyproject_toml
 
 if TYPE_CHECKING:
     from collections.abc import Mapping
@@ -19,6 +20,8 @@ if TYPE_CHECKING:
 
     from deptry.dependency_getter.base import DependencyGetter
 
+_EMPTY_TABLE: Mapping[str, Any] = MappingProxyType({})
+
 
 @dataclass
 class DependencyGetterBuilder:
@@ -39,22 +42,24 @@ class DependencyGetterBuilder:
     requirements_files_dev: tuple[str, ...] = ()
 
     def build(self) -> DependencyGetter:
-        pyproject_toml_found = self._project_contains_pyproject_toml()
+        clear_pyproject_toml_cache()
 
-        if pyproject_toml_found:
-            pyproject_toml = load_pyproject_toml(self.config)
+        pyproject_toml = self._load_pyproject_toml()
 
-            if self._project_uses_poetry(pyproject_toml):
+        if pyproject_toml is not None:
+            tool = pyproject_toml.get("tool", _EMPTY_TABLE)
+
+            if self._project_uses_poetry(tool):
                 return PoetryDependencyGetter(
                     self.config, self.package_module_name_map, self.optional_dependencies_dev_groups
                 )
 
-            if self._project_uses_uv(pyproject_toml):
+            if self._project_uses_uv(tool):
                 return UvDependencyGetter(
                     self.config, self.package_module_name_map, self.optional_dependencies_dev_groups
                 )
 
-            if self._project_uses_pdm(pyproject_toml):
+            if self._project_uses_pdm(tool):
                 return PDMDependencyGetter(
                     self.config, self.package_module_name_map, self.optional_dependencies_dev_groups
                 )
@@ -72,65 +77,63 @@ class DependencyGetterBuilder:
 
         raise DependencySpecificationNotFoundError(self.requirements_files)
 
-    def _project_contains_pyproject_toml(self) -> bool:
-        if self.config.exists():
-            logging.debug("pyproject.toml found!")
-            return True
-        else:
+    def _load_pyproject_toml(self) -> dict[str, Any] | None:
+        try:
+            pyproject_toml = load_pyproject_toml(self.config)
+        except PyprojectFileNotFoundError:
             logging.debug("No pyproject.toml found.")
-            return False
+            return None
+
+        logging.debug("pyproject.toml found!")
+        return pyproject_toml
 
     @staticmethod
-    def _project_uses_poetry(pyproject_toml: dict[str, Any]) -> bool:
-        try:
-            pyproject_toml["tool"]["poetry"]
+    def _project_uses_poetry(tool: Mapping[str, Any]) -> bool:
+        if "poetry" in tool:
             logging.debug(
                 "pyproject.toml contains a [tool.poetry] section, so Poetry is used to specify the"
                 " project's dependencies."
             )
-        except KeyError:
-            logging.debug(
-                "pyproject.toml does not contain a [tool.poetry] section, so Poetry is not used to specify"
-                " the project's dependencies."
-            )
-            return False
-        else:
             return True
 
+        logging.debug(
+            "pyproject.toml does not contain a [tool.poetry] section, so Poetry is not used to specify"
+            " the project's dependencies."
+        )
+        return False
+
     @staticmethod
-    def _project_uses_pdm(pyproject_toml: dict[str, Any]) -> bool:
-        try:
-            pyproject_toml["tool"]["pdm"]["dev-dependencies"]
+    def _project_uses_pdm(tool: Mapping[str, Any]) -> bool:
+        pdm_config = tool.get("pdm")
+        if pdm_config is not None and "dev-dependencies" in pdm_config:
             logging.debug(
                 "pyproject.toml contains a [tool.pdm.dev-dependencies] section, so PDM is used to specify the project's"
                 " dependencies."
             )
-        except KeyError:
-            logging.debug(
-                "pyproject.toml does not contain a [tool.pdm.dev-dependencies] section, so PDM is not used to specify"
-                " the project's dependencies."
-            )
-            return False
-        else:
             return True
 
+        logging.debug(
+            "pyproject.toml does not contain a [tool.pdm.dev-dependencies] section, so PDM is not used to specify"
+            " the project's dependencies."
+        )
+        return False
+
     @staticmethod
-    def _project_uses_uv(pyproject_toml: dict[str, Any]) -> bool:
-        try:
-            pyproject_toml["tool"]["uv"]["dev-dependencies"]
+    def _project_uses_uv(tool: Mapping[str, Any]) -> bool:
+        uv_config = tool.get("uv")
+        if uv_config is not None and "dev-dependencies" in uv_config:
             logging.debug(
                 "pyproject.toml contains a [tool.uv.dev-dependencies] section, so uv is used to specify the project's"
                 " dependencies."
             )
-        except KeyError:
-            logging.debug(
-                "pyproject.toml does not contain a [tool.uv.dev-dependencies] section, so uv is not used to specify the"
-                " project's dependencies."
-            )
-            return False
-        else:
             return True
 
+        logging.debug(
+            "pyproject.toml does not contain a [tool.uv.dev-dependencies] section, so uv is not used to specify the"
+            " project's dependencies."
+        )
+        return False
+
     @staticmethod
     def _project_uses_pep_621(pyproject_toml: dict[str, Any]) -> bool:
         if pyproject_toml.get("project"):
@@ -60,26 +60,24 @@ class PEP621DependencyGetter(DependencyGetter):
     def _get_dependencies(self) -> list[Dependency]:
         """Extract dependencies from `[project.dependencies]` (https://packaging.python.org/en/latest/specifications/pyproject-toml/#dependencies-optional-dependencies)."""
         pyproject_data = load_pyproject_toml(self.config)
+        project = pyproject_data.get("project", {})
 
-        if self._project_uses_setuptools(pyproject_data) and "dependencies" in pyproject_data.get("project", {}).get(
-            "dynamic", {}
-        ):
+        if self._project_uses_setuptools(pyproject_data) and "dependencies" in project.get("dynamic", ()):
             dependencies_files = pyproject_data["tool"]["setuptools"]["dynamic"]["dependencies"]["file"]
             if isinstance(dependencies_files, str):
                 dependencies_files = [dependencies_files]
 
             return get_dependencies_from_requirements_files(dependencies_files, self.package_module_name_map)
 
-        dependency_strings: list[str] = pyproject_data.get("project", {}).get("dependencies", [])
+        dependency_strings: list[str] = project.get("dependencies", [])
         return self._extract_pep_508_dependencies(dependency_strings)
 
     def _get_optional_dependencies(self) -> dict[str, list[Dependency]]:
         """Extract dependencies from `[project.optional-dependencies]` (https://packaging.python.org/en/latest/specifications/pyproject-toml/#dependencies-optional-dependencies)."""
         pyproject_data = load_pyproject_toml(self.config)
+        project = pyproject_data.get("project", {})
 
-        if self._project_uses_setuptools(pyproject_data) and "optional-dependencies" in pyproject_data.get(
-            "project", {}
-        ).get("dynamic", {}):
+        if self._project_uses_setuptools(pyproject_data) and "optional-dependencies" in project.get("dynamic", ()):
             return {
                 group: get_dependencies_from_requirements_files(
                     [specification["file"]] if isinstance(specification["file"], str) else specification["file"],
@@ -92,7 +90,7 @@ class PEP621DependencyGetter(DependencyGetter):
 
         return {
             group: self._extract_pep_508_dependencies(dependencies)
-            for group, dependencies in pyproject_data.get("project", {}).get("optional-dependencies", {}).items()
+            for group, dependencies in project.get("optional-dependencies", {}).items()
         }
 
     def _get_dependency_groups_dependencies(self) -> dict[str, list[Dependency]]:
@@ -140,13 +138,17 @@ class PEP621DependencyGetter(DependencyGetter):
             return False
 
     def _check_for_invalid_group_names(self, optional_dependencies: dict[str, list[Dependency]]) -> None:
-        missing_groups = set(self.optional_dependencies_dev_groups) - set(optional_dependencies.keys())
+        missing_groups = [
+            group
+            for group in dict.fromkeys(self.optional_dependencies_dev_groups)
+            if group not in optional_dependencies
+        ]
         if missing_groups:
             logging.warning(
                 "Warning: Trying to extract the dependencies from the optional dependency groups %s as development dependencies, "
                 "but the following groups were not found: %s",
                 list(self.optional_dependencies_dev_groups),
-                list(missing_groups),
+                missing_groups,
             )
 
     def _split_development_dependencies_from_optional_dependencies(
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import sys
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -17,8 +18,22 @@ else:
 
 
 def load_pyproject_toml(config: Path) -> dict[str, Any]:
+    """
+    Load and parse a `pyproject.toml` file. Parsed files are cached on their resolved path, so that the multiple
+    places that need to read the same file only parse it once. The returned data is shared between callers, and
+    should therefore not be mutated.
+    """
+    return _load_toml_file(config.resolve())
+
+
+def clear_pyproject_toml_cache() -> None:
+    """Clear the cache of parsed `pyproject.toml` files."""
+    _load_toml_file.cache_clear()
+
+
+@functools.cache
+def _load_toml_file(path: Path) -> dict[str, Any]:
     try:
-        with config.open("rb") as pyproject_file:
-            return tomllib.load(pyproject_file)
+        return tomllib.loads(path.read_bytes().decode())
     except FileNotFoundError:
         raise PyprojectFileNotFoundError(Path.cwd()) from None
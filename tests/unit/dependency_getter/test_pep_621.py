@@ -378,3 +378,27 @@ dependencies = { file = "requirements.txt" }
         assert len(dev_dependencies) == 0
 
         assert dependencies[0].name == "foo"
+
+
+def test_dependency_getter_with_multiple_incorrect_dev_groups(tmp_path: Path, caplog: LogCaptureFixture) -> None:
+    fake_pyproject_toml = """[project]
+name = "foo"
+dependencies = ["qux"]
+
+[project.optional-dependencies]
+group1 = ["foobar"]
+"""
+
+    with run_within_dir(tmp_path), caplog.at_level(logging.INFO):
+        with Path("pyproject.toml").open("w") as f:
+            f.write(fake_pyproject_toml)
+
+        getter = PEP621DependencyGetter(
+            config=Path("pyproject.toml"), optional_dependencies_dev_groups=("group4", "group1", "group3", "group4")
+        )
+        getter.get()
+
+        assert (
+            "Trying to extract the dependencies from the optional dependency groups ['group4', 'group1', 'group3', 'group4'] as development dependencies, but the following groups were not found: ['group4', 'group3']"
+            in caplog.text
+        )
@@ -5,7 +5,7 @@ from pathlib import Path
 import pytest
 
 from deptry.exceptions import PyprojectFileNotFoundError
-from deptry.utils import load_pyproject_toml
+from deptry.utils import clear_pyproject_toml_cache, load_pyproject_toml
 from tests.utils import run_within_dir
 
 
@@ -36,3 +36,22 @@ dev = ["foobar", "foobaz"]
 def test_load_pyproject_toml_not_found(tmp_path: Path) -> None:
     with run_within_dir(tmp_path), pytest.raises(PyprojectFileNotFoundError):
         load_pyproject_toml(Path("non_existing_pyproject.toml"))
+
+
+def test_load_pyproject_toml_is_cached(tmp_path: Path) -> None:
+    with run_within_dir(tmp_path):
+        with Path("pyproject.toml").open("w") as f:
+            f.write('[project]\nname = "foo"')
+
+        pyproject_data = load_pyproject_toml(Path("pyproject.toml"))
+        assert load_pyproject_toml(Path("./pyproject.toml")) is pyproject_data
+        assert load_pyproject_toml(tmp_path / "pyproject.toml") is pyproject_data
+
+        with Path("pyproject.toml").open("w") as f:
+            f.write('[project]\nname = "bar"')
+
+        assert load_pyproject_toml(Path("pyproject.toml")) == {"project": {"name": "foo"}}
+
+        clear_pyproject_toml_cache()
+
+        assert load_pyproject_toml(Path("pyproject.toml")) == {"project": {"name": "bar"}}